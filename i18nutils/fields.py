@@ -1,15 +1,14 @@
+import inspect
 import logging
 from typing import Union, Optional, Dict, Generator, Any, Callable, Tuple
-from django.conf import settings
 from django.db.models.fields import Field, CharField, TextField, SlugField
+from django.db.models.query_utils import DeferredAttribute
+from . import utils
 from .utils import i18nString
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Get languages from settings
-LANGUAGES = ['default'] + [x[0] for x in getattr(settings, 'LANGUAGES', [])]
-
 def to_attr_name(name: str, lang: str) -> str:
     """
     Generates an attribute name based on the field name and language.
@@ -40,7 +39,7 @@ class i18nField:
         self._field: Field = field
         self.editable: bool = False
         self.creation_counter: int = Field.creation_counter
-        Field.creation_counter += len(LANGUAGES)
+        Field.creation_counter += len(utils.LANGUAGES)
         logger.debug("Initialized i18nField with field: %s", field)
 
     def contribute_to_class(self, cls: Any, name: str, private_only: bool = False) -> None:
@@ -53,18 +52,26 @@ class i18nField:
             private_only (bool, optional): Whether to mark the field as private.
         """
         self._name: str = name
+        self._lang_attrs: Tuple[Tuple[str, str], ...] = tuple(
+            (lang, to_attr_name(name, lang)) for lang in utils.LANGUAGES
+        )
+        self._attr_names: Dict[str, str] = dict(self._lang_attrs)
         setattr(cls, name, self)
 
+        # Per model class: whether values can be written straight into the
+        # instance __dict__ (see _can_set_directly).
+        self._direct_set: Dict[type, bool] = dict()
+
         _, _, args, kwargs = self._field.deconstruct()
 
-        for idx, lang in enumerate(LANGUAGES):
+        for idx, (lang, attr) in enumerate(self._lang_attrs):
             kwargs.update({
                 'verbose_name': "%s (%s)" % (self._field.verbose_name or name, lang),
                 'db_column': None
             })
             f = self._field.__class__(*args, **kwargs)
             f.creation_counter = self.creation_counter + idx
-            f.contribute_to_class(cls, to_attr_name(name, lang), private_only)
+            f.contribute_to_class(cls, attr, private_only)
             logger.debug("Contributed field for language '%s': %s", lang, f)
 
     def __get__(self, obj: Any, objtype: Optional[type] = None) -> Union['i18nField', i18nString]:
@@ -80,14 +87,16 @@ class i18nField:
         """
         if obj is None:
             return self
+        # Loaded column values live in the instance __dict__; only deferred
+        # columns need to go through the descriptor to be fetched.
+        values = obj.__dict__
         data: Dict[str, str] = dict()
-        for lang in LANGUAGES:
-            attr = to_attr_name(self._name, lang)
-            value = getattr(obj, attr)
+        for lang, attr in self._lang_attrs:
+            value = values[attr] if attr in values else getattr(obj, attr)
             if value:
                 data[lang] = value
         logger.debug("Retrieved i18nString data: %s", data)
-        return i18nString(data)
+        return i18nString._from_dict(data)
 
     def __set__(self, obj: Any, value: Union[Dict[str, str], i18nString, str, None]) -> None:
         """
@@ -97,17 +106,84 @@ class i18nField:
             obj (models.Model): The model instance.
             value (dict, i18nString, str, or None): The value to set.
         """
-        if isinstance(value, (dict, i18nString)):
-            for lang, v in value.items():
-                if lang not in LANGUAGES:
-                    raise ValueError('Language %s is not supported' % lang)
-                attr = to_attr_name(self._name, lang)
+        setter = self._SETTERS.get(type(value))
+        if setter is None:
+            if isinstance(value, (dict, i18nString)):
+                setter = '_set_translations'
+            elif isinstance(value, str):
+                setter = '_set_default'
+            else:
+                raise ValueError('Type %s is not supported' % type(value))
+        getattr(self, setter)(obj, value)
+
+    def _can_set_directly(self, obj: Any) -> bool:
+        """
+        Checks whether values can bypass setattr on the given instance.
+
+        Subclasses and proxies of the declaring model share this field, so the
+        answer is cached per model class. Writing to the instance __dict__ is
+        only safe if the class keeps the default __setattr__ and every language
+        attribute is still a plain DeferredAttribute; any other descriptor
+        (e.g. a property or a field tracker) must be called.
+
+        Args:
+            obj (models.Model): The model instance.
+
+        Returns:
+            bool: True if values can be written to the instance __dict__.
+        """
+        cls = type(obj)
+        direct = self._direct_set.get(cls)
+        if direct is None:
+            direct = self._direct_set[cls] = cls.__setattr__ is object.__setattr__ and all(
+                type(inspect.getattr_static(cls, attr, None)) is DeferredAttribute
+                for _, attr in self._lang_attrs
+            )
+        return direct
+
+    def _set_translations(self, obj: Any, value: Union[Dict[str, str], i18nString]) -> None:
+        """
+        Sets one translation per language from a mapping.
+
+        Args:
+            obj (models.Model): The model instance.
+            value (dict or i18nString): The translations to set, keyed by language.
+        """
+        attr_names = self._attr_names
+        values: Dict[str, str] = dict()
+        for lang, v in value.items():
+            attr = attr_names.get(lang)
+            if attr is None:
+                raise ValueError('Language %s is not supported' % lang)
+            values[attr] = v
+        if self._can_set_directly(obj):
+            obj.__dict__.update(values)
+        else:
+            for attr, v in values.items():
                 setattr(obj, attr, v)
-                logger.debug("Set attribute '%s' to '%s' for language '%s'", attr, v, lang)
-        elif value is None or isinstance(value, str):
-            attr = to_attr_name(self._name, 'default')
-            setattr(obj, attr, value)
-            logger.debug("Set default attribute '%s' to '%s'", attr, value)
+        logger.debug("Set attributes: %s", values)
+
+    def _set_default(self, obj: Any, value: Optional[str]) -> None:
+        """
+        Sets the default translation from a plain string or None.
+
+        Args:
+            obj (models.Model): The model instance.
+            value (str or None): The value to set.
+        """
+        attr = self._attr_names['default']
+        if self._can_set_directly(obj):
+            obj.__dict__[attr] = value
         else:
-            raise ValueError('Type %s is not supported' % type(value))
+            setattr(obj, attr, value)
+        logger.debug("Set default attribute '%s' to '%s'", attr, value)
+
+    # Exact-type dispatch for __set__ to setter method names, so subclasses can
+    # override the setters; value subclasses fall back to isinstance checks.
+    _SETTERS: Dict[type, str] = {
+        dict: '_set_translations',
+        i18nString: '_set_translations',
+        str: '_set_default',
+        type(None): '_set_default',
+    }
 
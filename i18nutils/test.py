@@ -1,49 +1,166 @@
-from typing import Dict, Union
-from django.test import TestCase
+import copy
+import inspect
+from collections import OrderedDict, UserString
+from types import SimpleNamespace
+from typing import Any, Dict, Union
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.db import models
+from django.db.models.fields import Field
+from django.utils import translation
 from .models import TestModel  # Adjust import to match your project's structure
+from . import utils
 from .utils import i18nString
 from .fields import i18nField, to_attr_name
 
-class i18nFieldTestCase(TestCase):
+class SetattrTestModel(TestModel):
+    """
+    A proxy of TestModel that records attribute assignments through __setattr__.
+    """
 
-    def setUp(self) -> None:
-        """
-        Set up the test environment.
-        """
-        self.model: TestModel = TestModel.objects.create(
-            title={"default": "Default Title", "en": "English Title", "fr": "Titre Français"}
-        )
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.setdefault('assigned', set()).add(name)
+        super().__setattr__(name, value)
 
-    def test_to_attr_name(self) -> None:
+    class Meta:
+        proxy = True
+        app_label = TestModel._meta.app_label
+
+class RecordingDescriptor:
+    """
+    A data descriptor wrapping a field's DeferredAttribute, like a field tracker installs.
+    """
+
+    def __init__(self, wrapped: Any) -> None:
+        self.wrapped = wrapped
+        self.assigned: list = []
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        return self.wrapped.__get__(obj, objtype)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.assigned.append(value)
+        obj.__dict__[self.wrapped.field.attname] = value
+
+class DescriptorTestModel(TestModel):
+    """
+    A proxy of TestModel whose English title goes through a data descriptor.
+    """
+
+    class Meta:
+        proxy = True
+        app_label = TestModel._meta.app_label
+
+DescriptorTestModel.title_en = RecordingDescriptor(inspect.getattr_static(TestModel, 'title_en'))
+
+class i18nStringTestCase(SimpleTestCase):
+
+    EXPECTED_LANGS = frozenset({'default', 'en', 'fr'})
+    # Expected (language, translation) pairs for the greeting and sentence fixtures
+    GREETINGS = (('en', "Hello"), ('fr', "Bonjour"))
+    SENTENCES = (('en', "Hello World"), ('fr', "Bonjour Monde"))
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Test the `to_attr_name` utility function.
+        Set up the i18nString fixtures shared by every test in the class.
         """
-        attr_name: str = to_attr_name("title", "en")
-        self.assertEqual(attr_name, "title_en")
-
-        attr_name = to_attr_name("title", "fr")
-        self.assertEqual(attr_name, "title_fr")
+        super().setUpClass()
+        cls.greeting: i18nString = i18nString({"default": "Hello", "en": "Hello", "fr": "Bonjour"})
+        cls.subject: i18nString = i18nString({"default": " World", "en": " World", "fr": " Monde"})
+        cls.sentence: i18nString = cls.greeting + cls.subject
 
     def test_i18nString_initialization(self) -> None:
         """
         Test the initialization of the i18nString class.
         """
-        string: i18nString = i18nString({"default": "Hello", "en": "Hello", "fr": "Bonjour"})
-        self.assertIsInstance(string, i18nString)
-        self.assertEqual(string.trans('en'), "Hello")
-        self.assertEqual(string.trans('fr'), "Bonjour")
+        self.assertIsInstance(self.greeting, i18nString)
+        self.assertEqual(frozenset(self.greeting.langs()), self.EXPECTED_LANGS)
+        for lang, expected in self.GREETINGS:
+            with self.subTest(lang=lang), translation.override(lang):
+                self.assertEqual(self.greeting.trans(lang), expected)
+                self.assertEqual(str(self.greeting), expected)
 
     def test_i18nString_addition(self) -> None:
         """
         Test the addition of i18nString instances.
         """
-        string1: i18nString = i18nString({"default": "Hello", "en": "Hello", "fr": "Bonjour"})
-        string2: i18nString = i18nString({"default": " World", "en": " World", "fr": " Monde"})
+        self.assertIsInstance(self.sentence, i18nString)
+        for lang, expected in self.SENTENCES:
+            with self.subTest(lang=lang), translation.override(lang):
+                self.assertEqual(self.sentence.trans(lang), expected)
+                self.assertEqual(str(self.sentence), expected)
 
-        result: i18nString = string1 + string2
-        self.assertEqual(result.trans('en'), "Hello World")
-        self.assertEqual(result.trans('fr'), "Bonjour Monde")
+    def test_i18nString_string_protocol(self) -> None:
+        """
+        Test that comparison, containment, length and hashing use the active language.
+        """
+        with translation.override('fr'):
+            self.assertEqual(self.greeting, "Bonjour")
+            self.assertNotEqual(self.greeting, "Hello")
+            self.assertEqual(self.greeting, i18nString({"fr": "Bonjour"}))
+            self.assertEqual(self.greeting, UserString("Bonjour"))
+            self.assertIn(i18nString({"en": "Hell", "fr": "Bon"}), self.greeting)
+            self.assertNotIn(i18nString({"en": "Hell", "fr": "Hell"}), self.greeting)
+            self.assertEqual(len(self.greeting), len("Bonjour"))
+            self.assertEqual(hash(self.greeting), hash(str(self.greeting)))
+
+    def test_i18nString_set_trans(self) -> None:
+        """
+        Test that set_trans is reflected by an already rendered i18nString.
+        """
+        string: i18nString = i18nString({"default": "Hello", "en": "Hello"})
+        with translation.override('fr'):
+            self.assertEqual(str(string), "Hello")
+            string.set_trans('fr', "Bonjour")
+            self.assertEqual(str(string), "Bonjour")
+
+    def test_i18nString_set_default_trans(self) -> None:
+        """
+        Test that a new default is used by an already rendered fallback.
+        """
+        string: i18nString = i18nString({"default": "Hello", "en": "Hello"})
+        with translation.override('fr'):
+            self.assertEqual(str(string), "Hello")
+            string.set_trans('default', "Salut")
+            self.assertEqual(string.default_trans(), "Salut")
+            self.assertEqual(str(string), "Salut")
+
+    def test_i18nString_copies_source_dict(self) -> None:
+        """
+        Test that changing the source dict does not affect an i18nString.
+        """
+        data: Dict[str, str] = {"default": "Hello", "en": "Hello"}
+        string: i18nString = i18nString(data)
+        data["default"] = "Changed"
+        with translation.override('fr'):
+            self.assertEqual(string.trans('fr'), "Hello")
+            self.assertEqual(str(string), "Hello")
+
+    def test_i18nString_copy(self) -> None:
+        """
+        Test that a shallow copy and its original keep consistent defaults.
+        """
+        string: i18nString = i18nString({"default": "Hello", "en": "Hello"})
+        with translation.override('fr'):
+            self.assertEqual(str(string), "Hello")
+            string_copy: i18nString = copy.copy(string)
+            string_copy.set_trans('default', "Salut")
+            self.assertEqual(string_copy.trans('fr'), "Salut")
+            self.assertEqual(str(string_copy), "Salut")
+            self.assertEqual(string.trans('fr'), "Hello")
+            self.assertEqual(str(string), "Hello")
+
+class i18nFieldDefinitionTestCase(SimpleTestCase):
+
+    def test_to_attr_name(self) -> None:
+        """
+        Test the `to_attr_name` utility function.
+        """
+        attr_name: str = to_attr_name("title", "en")
+        self.assertEqual(attr_name, "title_en")
+
+        attr_name = to_attr_name("title", "fr")
+        self.assertEqual(attr_name, "title_fr")
 
     def test_i18nField_initialization(self) -> None:
         """
@@ -53,15 +170,63 @@ class i18nFieldTestCase(TestCase):
         self.assertIsInstance(field._field, models.CharField)
         self.assertFalse(field.editable)
 
+    def test_i18nField_subclass_setter(self) -> None:
+        """
+        Test that __set__ dispatches to setters overridden in a subclass.
+        """
+        class RecordingField(i18nField):
+            def _set_default(self, obj, value):
+                obj.recorded = value
+
+        field: i18nField = RecordingField(models.CharField(max_length=255))
+        obj: SimpleNamespace = SimpleNamespace()
+        field.__set__(obj, "Plain Title")
+        self.assertEqual(obj.recorded, "Plain Title")
+
+    @override_settings(LANGUAGES=[('en', 'English'), ('fr', 'French'), ('de', 'German')])
+    def test_i18nField_overridden_languages(self) -> None:
+        """
+        Test that i18nField follows an overridden LANGUAGES setting.
+        """
+        self.assertEqual(utils.LANGUAGES, ('default', 'en', 'fr', 'de'))
+        wrapped: models.CharField = models.CharField(max_length=255)
+        counter: int = Field.creation_counter
+        i18nField(wrapped)
+        self.assertEqual(Field.creation_counter - counter, len(utils.LANGUAGES))
+
+class i18nFieldTestCase(TestCase):
+
+    # (language, translation) pairs stored in the shared model's title
+    TITLES = (('default', "Default Title"), ('en', "English Title"), ('fr', "Titre Français"))
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up the test data shared by every test in the class.
+        """
+        cls.model: TestModel = TestModel.objects.create(title=dict(cls.TITLES))
+
     def test_i18nField_data_retrieval(self) -> None:
         """
         Test the retrieval of data from the i18nField.
         """
-        title: i18nString = self.model.title
+        with self.assertNumQueries(0):
+            title: i18nString = self.model.title
         self.assertIsInstance(title, i18nString)
-        self.assertEqual(title.trans('default'), "Default Title")
-        self.assertEqual(title.trans('en'), "English Title")
-        self.assertEqual(title.trans('fr'), "Titre Français")
+        for lang, expected in self.TITLES:
+            with self.subTest(lang=lang):
+                self.assertEqual(title.trans(lang), expected)
+
+    def test_i18nField_deferred_data_retrieval(self) -> None:
+        """
+        Test that deferred language columns are loaded on access.
+        """
+        model: TestModel = TestModel.objects.defer(to_attr_name("title", "fr")).get(pk=self.model.pk)
+        with self.assertNumQueries(1):
+            title: i18nString = model.title
+        for lang, expected in self.TITLES:
+            with self.subTest(lang=lang):
+                self.assertEqual(title.trans(lang), expected)
 
     def test_i18nField_data_setting(self) -> None:
         """
@@ -74,9 +239,64 @@ class i18nFieldTestCase(TestCase):
         self.model.refresh_from_db()
         title: i18nString = self.model.title
 
-        self.assertEqual(title.trans('default'), "New Default Title")
-        self.assertEqual(title.trans('en'), "New English Title")
-        self.assertEqual(title.trans('fr'), "Titre Français")  # Should remain unchanged
+        # 'fr' was not part of the update and should remain unchanged
+        for lang, expected in dict(new_title, fr="Titre Français").items():
+            with self.subTest(lang=lang):
+                self.assertEqual(title.trans(lang), expected)
+
+    def test_i18nField_set_none(self) -> None:
+        """
+        Test setting None clears the default translation.
+        """
+        self.model.title = None
+        self.assertIsNone(self.model.title_default)
+        self.assertEqual(self.model.title_en, "English Title")
+
+    def test_i18nField_set_value_subclasses(self) -> None:
+        """
+        Test setting values whose types subclass str and dict.
+        """
+        class TitleString(str):
+            pass
+
+        self.model.title = TitleString("Subclassed Title")
+        self.assertEqual(self.model.title_default, "Subclassed Title")
+
+        self.model.title = OrderedDict([("en", "Ordered English Title"), ("fr", "Titre ordonné")])
+        self.assertEqual(self.model.title_en, "Ordered English Title")
+        self.assertEqual(self.model.title_fr, "Titre ordonné")
+
+    def test_i18nField_setattr_round_trip(self) -> None:
+        """
+        Test saving values set directly and through a model's __setattr__.
+        """
+        for model_class in (TestModel, SetattrTestModel):
+            with self.subTest(model=model_class.__name__):
+                model: TestModel = model_class.objects.get(pk=self.model.pk)
+                model.__dict__['assigned'] = set()
+                model.title = {"en": "Round Trip Title"}
+                model.title = "Round Trip Default"
+                if model_class is SetattrTestModel:
+                    self.assertEqual(model.assigned, {'title', 'title_en', 'title_default'})
+
+                model.save()
+                model.refresh_from_db()
+                title: i18nString = model.title
+                self.assertEqual(title.trans('en'), "Round Trip Title")
+                self.assertEqual(title.trans('default'), "Round Trip Default")
+                self.assertEqual(title.trans('fr'), "Titre Français")
+
+    def test_i18nField_data_descriptor(self) -> None:
+        """
+        Test that a data descriptor on a language attribute is not bypassed.
+        """
+        descriptor: RecordingDescriptor = inspect.getattr_static(DescriptorTestModel, 'title_en')
+        model: TestModel = DescriptorTestModel.objects.get(pk=self.model.pk)
+        descriptor.assigned.clear()
+        model.title = {"en": "Tracked Title", "fr": "Titre suivi"}
+        self.assertEqual(descriptor.assigned, ["Tracked Title"])
+        self.assertEqual(model.title.trans('en'), "Tracked Title")
+        self.assertEqual(model.title.trans('fr'), "Titre suivi")
 
     def test_i18nField_invalid_language(self) -> None:
         """
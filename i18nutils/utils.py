@@ -1,6 +1,8 @@
 import logging
 from typing import Union, Optional, Dict, Generator, Any, Callable, Tuple, List
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.db.models.fields import Field, CharField, TextField, SlugField
 from collections import UserString
 from django.utils import translation
@@ -9,8 +11,37 @@ from django.utils.functional import Promise
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Bound once so hot paths skip the attribute lookup on the translation module
+_get_language = translation.get_language
 
 
+def _build_language_codes() -> Tuple[str, ...]:
+    """
+    Reads the configured language codes from settings.
+
+    Returns:
+        tuple: The codes in settings.LANGUAGES.
+    """
+    return tuple(code for code, _ in getattr(settings, 'LANGUAGES', []))
+
+# Get languages from settings
+_LANGUAGE_CODES: Tuple[str, ...] = _build_language_codes()
+LANGUAGES: Tuple[str, ...] = ('default',) + _LANGUAGE_CODES
+
+@receiver(setting_changed)
+def _update_languages(setting: str, **kwargs: Any) -> None:
+    """
+    Rebuilds the cached languages when settings.LANGUAGES is overridden (e.g. in tests).
+
+    Args:
+        setting (str): The name of the changed setting.
+    """
+    global _LANGUAGE_CODES, LANGUAGES
+    if setting == 'LANGUAGES':
+        _LANGUAGE_CODES = _build_language_codes()
+        LANGUAGES = ('default',) + _LANGUAGE_CODES
+        logger.debug("Rebuilt LANGUAGES: %s", LANGUAGES)
+
 class i18nString(Promise, UserString):
     """
     Custom string class for handling internationalization.
@@ -19,6 +50,11 @@ class i18nString(Promise, UserString):
 
     DEFAULT_LANGUAGE: Optional[str] = getattr(settings, 'I18NSTRING_DEFAULT_LANGUAGE', None)
 
+    # Resolved by default_trans() on first use and reset whenever the default changes
+    _default_value: Optional[str] = None
+    # Resolved __str__ values per active language, created on first str()
+    _str_cache: Optional[Dict[Optional[str], str]] = None
+
     def __init__(self, seq: Union[str, Dict[str, str]] = '') -> None:
         """
         Initializes an i18nString instance.
@@ -29,6 +65,23 @@ class i18nString(Promise, UserString):
         self._data: Dict[str, str] = {}
         self.data: Union[str, Dict[str, str]] = seq
 
+    @classmethod
+    def _from_dict(cls, data: Dict[str, str]) -> 'i18nString':
+        """
+        Builds an i18nString that takes over a freshly built dict without copying it.
+
+        For internal callers only; the dict must not be changed afterwards.
+
+        Args:
+            data (dict): The translations, keyed by language.
+
+        Returns:
+            i18nString: The new i18nString.
+        """
+        string = cls.__new__(cls)
+        string._data = data
+        return string
+
     def __add__(self, other: Union[str, 'i18nString']) -> Union[str, 'i18nString']:
         """
         Adds another string or i18nString to this i18nString.
@@ -40,13 +93,92 @@ class i18nString(Promise, UserString):
             i18nString: The combined string.
         """
         if isinstance(other, i18nString):
-            data = dict()
-            for lang in set(self.langs() + other.langs()):
-                data[lang] = self.trans(lang) + other.trans(lang)
-            return self.__class__(data)
+            self_trans, other_trans = self.trans, other.trans
+            data = {
+                lang: self_trans(lang) + other_trans(lang)
+                for lang in self._data.keys() | other._data.keys()
+            }
+            return self._from_dict(data)
         else:
             return self.data + str(other)
 
+    def __copy__(self) -> 'i18nString':
+        """
+        Returns a shallow copy rebuilt from the translations of this i18nString.
+
+        Returns:
+            i18nString: The copy.
+        """
+        return self.__class__(self._data)
+
+    def __str__(self) -> str:
+        """
+        Returns the translation for the active language.
+
+        Returns:
+            str: The translated string.
+        """
+        lang = _get_language()
+        cache = self._str_cache
+        if cache is None:
+            cache = self._str_cache = {}
+        value = cache.get(lang)
+        if value is None:
+            value = cache[lang] = str(self.trans(lang))
+        return value
+
+    def __len__(self) -> int:
+        """
+        Returns the length of the translation for the active language.
+
+        Returns:
+            int: The length of the translated string.
+        """
+        return len(self.trans(_get_language()))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compares the active-language translation with another string.
+
+        Args:
+            other (str or i18nString): The value to compare with.
+
+        Returns:
+            bool: True if both resolve to the same string.
+        """
+        lang = _get_language()
+        if isinstance(other, i18nString):
+            other = other.trans(lang)
+        elif isinstance(other, UserString):
+            other = other.data
+        return self.trans(lang) == other
+
+    def __hash__(self) -> int:
+        """
+        Hashes the translation for the active language.
+
+        Returns:
+            int: The hash of the translated string.
+        """
+        return hash(self.trans(_get_language()))
+
+    def __contains__(self, char: Any) -> bool:
+        """
+        Checks whether a substring is in the active-language translation.
+
+        Args:
+            char (str or i18nString): The substring to look for.
+
+        Returns:
+            bool: True if the substring is found.
+        """
+        lang = _get_language()
+        if isinstance(char, i18nString):
+            char = char.trans(lang)
+        elif isinstance(char, UserString):
+            char = char.data
+        return char in self.trans(lang)
+
     def __set_data(self, data: Union[str, Dict[str, str]]) -> None:
         """
         Sets the data for this i18nString.
@@ -55,9 +187,12 @@ class i18nString(Promise, UserString):
             data (str or dict): The data to set.
         """
         if isinstance(data, dict):
-            self._data = data
+            # Own a copy so the cached lookups below cannot go stale
+            self._data = dict(data)
         else:
-            self._data[translation.get_language()] = str(data)
+            self._data[_get_language()] = str(data)
+        self._default_value = None
+        self._str_cache = None
 
     def __get_data(self) -> str:
         """
@@ -79,6 +214,9 @@ class i18nString(Promise, UserString):
             text (str): The translated text.
         """
         self._data[lang] = text
+        if lang == 'default' or lang == self.DEFAULT_LANGUAGE:
+            self._default_value = None
+        self._str_cache = None
         logger.debug("Set translation for language '%s': %s", lang, text)
 
     def trans(self, lang: str) -> str:
@@ -91,12 +229,14 @@ class i18nString(Promise, UserString):
         Returns:
             str: The translated string.
         """
-        data = self._data.get(lang, None)
-        if data is None and lang and "-" in lang:
-            base_lang = lang.split('-')[0]
-            data = self._data.get(base_lang, None)
+        data = self._data.get(lang)
         if data is None:
-            data = self.default_trans()
+            # Fall back to the base language ('fr-ca' -> 'fr'), then the default
+            sep = lang.find('-') if lang else -1
+            if sep > 0:
+                data = self._data.get(lang[:sep])
+            if data is None:
+                data = self.default_trans()
         logger.debug("Translation for language '%s': %s", lang, data)
         return data
 
@@ -104,6 +244,18 @@ class i18nString(Promise, UserString):
         """
         Retrieves the default translation.
 
+        Returns:
+            str: The default translated string.
+        """
+        value = self._default_value
+        if value is None:
+            value = self._default_value = self._resolve_default()
+        return value
+
+    def _resolve_default(self) -> str:
+        """
+        Looks up the default translation in the stored data.
+
         Returns:
             str: The default translated string.
         """
@@ -119,7 +271,7 @@ class i18nString(Promise, UserString):
         Returns:
             str: The language code.
         """
-        return translation.get_language()
+        return _get_language()
 
     def langs(self) -> List[str]:
         """
@@ -151,17 +303,17 @@ def i18nDecorator(func: Callable[..., Any], formatter: Optional[Callable[[Any],
     Returns:
         function: The wrapped function that returns an i18nString.
     """
+    fmt: Callable[[Any], str] = formatter or str
+
     def wrapper(*args: Any, **kwargs: Any) -> i18nString:
         data: Dict[str, str] = dict()
-        for lang, _ in settings.LANGUAGES:
+        for lang in _LANGUAGE_CODES:
             with translation.override(lang):
-                if formatter:
-                    data[lang] = formatter(func(*args, **kwargs))
-                else:
-                    data[lang] = str(func(*args, **kwargs))
-        if len(set(data.values())) == 1:
-            data = {'default': list(data.values())[0]}
-        return i18nString(data)
+                data[lang] = fmt(func(*args, **kwargs))
+        values = set(data.values())
+        if len(values) == 1:
+            data = {'default': values.pop()}
+        return i18nString._from_dict(data)
     return wrapper
 
     